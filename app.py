@@ -3,10 +3,11 @@ from datetime import datetime
 
 from flask import (
     Flask, render_template, request,
-    redirect, url_for, session, flash
+    redirect, url_for, session, flash, g
 )
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from sqlalchemy.orm import configure_mappers, selectinload
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
 
@@ -18,7 +19,9 @@ app.secret_key = "change-this-secret-key-in-production"
 
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
-app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///" + os.path.join(BASE_DIR, "app.db")
+app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get(
+    "DATABASE_URL", "sqlite:///" + os.path.join(BASE_DIR, "app.db")
+)
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
 UPLOAD_FOLDER = os.path.join(BASE_DIR, "static", "uploads")
@@ -99,6 +102,11 @@ class Order(db.Model):
     listing = db.relationship("Listing", backref="orders")
 
 
+# Create the backref attributes (e.g. Listing.seller) now, so the query
+# builders below can reference them before the first query runs.
+configure_mappers()
+
+
 # -------------------------------------------------
 # Helpers
 # -------------------------------------------------
@@ -107,10 +115,65 @@ def allowed_file(filename: str) -> bool:
 
 
 def get_current_user():
+    # Cached per request; the async views in asgi.py also pre-load it here
+    if "current_user" in g:
+        return g.current_user
     user_id = session.get("user_id")
-    if not user_id:
-        return None
-    return User.query.get(user_id)
+    g.current_user = User.query.get(user_id) if user_id else None
+    return g.current_user
+
+
+# Query builders below are shared by the sync views and the async ones in
+# asgi.py. Relationships the templates read are eager-loaded, since an async
+# session can't lazy-load them.
+def latest_listings(listing_type: str):
+    return db.select(Listing).filter_by(listing_type=listing_type) \
+        .order_by(Listing.datePosted.desc()) \
+        .options(selectinload(Listing.seller))
+
+
+def filtered_listings(listing_type: str):
+    """
+    Listing query for the store and marketplace pages, built from the
+    category/search args.
+    """
+    category_filter = request.args.get("category", "all")
+    search_query = request.args.get("search", "").strip()
+
+    query = latest_listings(listing_type)
+
+    if category_filter != "all":
+        query = query.filter_by(category=category_filter)
+
+    if search_query:
+        search_pattern = f"%{search_query}%"
+        query = query.filter(
+            db.or_(
+                Listing.itemName.ilike(search_pattern),
+                Listing.description.ilike(search_pattern)
+            )
+        )
+
+    return query, category_filter, search_query
+
+
+def dashboard_queries(user) -> dict:
+    """One query per dashboard panel, keyed by template variable."""
+    transaction_options = (
+        selectinload(Transaction.listing),
+        selectinload(Transaction.buyer),
+        selectinload(Transaction.seller),
+    )
+    return {
+        # Listings user currently has up for sale (student marketplace)
+        "listings": db.select(Listing).filter_by(seller_id=user.id, listing_type="student_listing"),
+        # Student marketplace purchases (you bought from others)
+        "purchases": db.select(Transaction).filter_by(buyer_id=user.id).options(*transaction_options),
+        # Student marketplace sales (others bought from you)
+        "sales": db.select(Transaction).filter_by(seller_id=user.id).options(*transaction_options),
+        # EMU store orders (official merch)
+        "store_orders": db.select(Order).filter_by(user_id=user.id).options(selectinload(Order.listing)),
+    }
 
 
 @app.context_processor
@@ -185,14 +248,10 @@ def logout():
 def index():
     """Homepage with featured items from both store and marketplace"""
     # Get latest official store items
-    store_items = Listing.query.filter_by(listing_type="official_store") \
-        .order_by(Listing.datePosted.desc()) \
-        .limit(4).all()
+    store_items = db.session.scalars(latest_listings("official_store").limit(4)).all()
 
     # Get latest student listings
-    student_items = Listing.query.filter_by(listing_type="student_listing") \
-        .order_by(Listing.datePosted.desc()) \
-        .limit(4).all()
+    student_items = db.session.scalars(latest_listings("student_listing").limit(4)).all()
 
     return render_template("index.html", store_items=store_items, student_items=student_items)
 
@@ -200,48 +259,16 @@ def index():
 @app.route("/store")
 def store():
     """Official EMU Store"""
-    category_filter = request.args.get("category", "all")
-    search_query = request.args.get("search", "").strip()
-
-    query = Listing.query.filter_by(listing_type="official_store").order_by(Listing.datePosted.desc())
-
-    if category_filter != "all":
-        query = query.filter_by(category=category_filter)
-
-    if search_query:
-        search_pattern = f"%{search_query}%"
-        query = query.filter(
-            db.or_(
-                Listing.itemName.ilike(search_pattern),
-                Listing.description.ilike(search_pattern)
-            )
-        )
-
-    listings = query.all()
+    query, category_filter, search_query = filtered_listings("official_store")
+    listings = db.session.scalars(query).all()
     return render_template("store.html", listings=listings, category_filter=category_filter, search_query=search_query)
 
 
 @app.route("/marketplace")
 def marketplace():
     """Student-to-Student Marketplace"""
-    category_filter = request.args.get("category", "all")
-    search_query = request.args.get("search", "").strip()
-
-    query = Listing.query.filter_by(listing_type="student_listing").order_by(Listing.datePosted.desc())
-
-    if category_filter != "all":
-        query = query.filter_by(category=category_filter)
-
-    if search_query:
-        search_pattern = f"%{search_query}%"
-        query = query.filter(
-            db.or_(
-                Listing.itemName.ilike(search_pattern),
-                Listing.description.ilike(search_pattern)
-            )
-        )
-
-    listings = query.all()
+    query, category_filter, search_query = filtered_listings("student_listing")
+    listings = db.session.scalars(query).all()
     return render_template("marketplace.html", listings=listings, category_filter=category_filter, search_query=search_query)
 
 
@@ -465,29 +492,12 @@ def dashboard():
 
     tab = request.args.get("tab", "overview")
 
-    # Listings user currently has up for sale (student marketplace)
-    listings = Listing.query.filter_by(
-        seller_id=user.id,
-        listing_type="student_listing"
-    ).all()
-
-    # Student marketplace purchases (you bought from others)
-    purchases = Transaction.query.filter_by(buyer_id=user.id).all()
-
-    # Student marketplace sales (others bought from you)
-    sales = Transaction.query.filter_by(seller_id=user.id).all()
+    panels = {
+        name: db.session.scalars(query).all()
+        for name, query in dashboard_queries(user).items()
+    }
 
-    # EMU store orders (official merch)
-    store_orders = Order.query.filter_by(user_id=user.id).all()
-
-    return render_template(
-        "dashboard.html",
-        tab=tab,
-        listings=listings,
-        purchases=purchases,
-        sales=sales,
-        store_orders=store_orders,
-    )
+    return render_template("dashboard.html", tab=tab, **panels)
 
 @app.route("/buy/<int:listing_id>", methods=["GET", "POST"])
 def buy_now(listing_id):
@@ -0,0 +1,188 @@
+"""
+Opt-in ASGI entry point for I/O-bound deployments.
+
+    GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker gunicorn -c gunicorn.conf.py asgi:application
+
+The read-heavy pages (index, store, marketplace, dashboard) are served by
+native async views backed by SQLAlchemy's asyncio engine, so a slow database
+read no longer pins a worker thread. Every other route falls through to the
+regular Flask app in app.py, which keeps working unchanged under
+`flask run` / `python app.py`.
+"""
+import asyncio
+import io
+import os
+
+from a2wsgi import WSGIMiddleware
+from a2wsgi.wsgi import build_environ
+from flask import render_template, request, redirect, url_for, session, g
+from flask.signals import request_started
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from werkzeug.exceptions import HTTPException
+
+from app import app, dashboard_queries, filtered_listings, latest_listings, User
+
+
+# -------------------------------------------------
+# Async database
+# -------------------------------------------------
+def _async_database_uri() -> str:
+    """Same database as the sync app, through an asyncio driver."""
+    if os.environ.get("ASYNC_DATABASE_URI"):
+        return os.environ["ASYNC_DATABASE_URI"]
+
+    url = make_url(app.config["SQLALCHEMY_DATABASE_URI"])
+    if url.drivername == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+async_engine = create_async_engine(_async_database_uri())
+AsyncSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+
+async def load_current_user(db_session):
+    """Async counterpart of app.get_current_user(); caches on g for the templates."""
+    user_id = session.get("user_id")
+    g.current_user = await db_session.get(User, user_id) if user_id else None
+    return g.current_user
+
+
+async def render_template_async(template_name, **context):
+    """
+    Render in a worker thread so Jinja doesn't block the event loop.
+    asyncio.to_thread copies the current context, which carries Flask's
+    request context over to the thread.
+    """
+    return await asyncio.to_thread(render_template, template_name, **context)
+
+
+# -------------------------------------------------
+# Async views
+# -------------------------------------------------
+async def index(db_session):
+    """Homepage with featured items from both store and marketplace"""
+    store_items = (await db_session.scalars(latest_listings("official_store").limit(4))).all()
+    student_items = (await db_session.scalars(latest_listings("student_listing").limit(4))).all()
+    return await render_template_async("index.html", store_items=store_items, student_items=student_items)
+
+
+async def store(db_session):
+    """Official EMU Store"""
+    query, category_filter, search_query = filtered_listings("official_store")
+    listings = (await db_session.scalars(query)).all()
+    return await render_template_async("store.html", listings=listings, category_filter=category_filter, search_query=search_query)
+
+
+async def marketplace(db_session):
+    """Student-to-Student Marketplace"""
+    query, category_filter, search_query = filtered_listings("student_listing")
+    listings = (await db_session.scalars(query)).all()
+    return await render_template_async("marketplace.html", listings=listings, category_filter=category_filter, search_query=search_query)
+
+
+async def dashboard(db_session):
+    user = g.current_user
+    if not user:
+        return redirect(url_for("login"))
+
+    tab = request.args.get("tab", "overview")
+
+    panels = {
+        name: (await db_session.scalars(query)).all()
+        for name, query in dashboard_queries(user).items()
+    }
+
+    return await render_template_async("dashboard.html", tab=tab, **panels)
+
+
+# Flask endpoint name -> async view
+ASYNC_VIEWS = {
+    "index": index,
+    "store": store,
+    "marketplace": marketplace,
+    "dashboard": dashboard,
+}
+
+
+# -------------------------------------------------
+# ASGI application
+# -------------------------------------------------
+# Everything without an async view runs the Flask app on a thread pool
+WSGI_THREADS = int(os.environ.get("WSGI_THREADS", 10))
+wsgi_application = WSGIMiddleware(app, workers=WSGI_THREADS)
+
+
+def match_async_view(environ):
+    """Return (view, view_args) if the request maps to an async view, else None."""
+    try:
+        endpoint, view_args = app.url_map.bind_to_environ(environ).match()
+    except HTTPException:
+        # 404s and trailing-slash redirects are left to Flask
+        return None
+    view = ASYNC_VIEWS.get(endpoint)
+    return (view, view_args) if view else None
+
+
+async def dispatch_async_view(view, view_args, environ):
+    # Mirrors Flask.wsgi_app() / full_dispatch_request() around an awaited view
+    with app.request_context(environ):
+        try:
+            try:
+                request_started.send(app, _async_wrapper=app.ensure_sync)
+                rv = app.preprocess_request()
+                if rv is None:
+                    async with AsyncSession() as db_session:
+                        await load_current_user(db_session)
+                        rv = await view(db_session, **view_args)
+            except Exception as e:
+                rv = app.handle_user_exception(e)
+            # Saves the session cookie (e.g. consumed flash messages) like Flask does
+            return app.finalize_request(rv)
+        except Exception as e:
+            return app.handle_exception(e)
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await async_engine.dispose()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+        return
+
+    if scope["type"] == "websocket":
+        # Nothing here speaks websockets; reject instead of handing it to WSGI
+        await receive()
+        await send({"type": "websocket.close", "code": 1000})
+        return
+
+    # Async views are all GET pages; uploads and other writes go straight to WSGI
+    if scope["method"] in ("GET", "HEAD"):
+        # No request body to pass through
+        environ = build_environ(scope, io.BytesIO(b""))
+        match = match_async_view(environ)
+        if match:
+            response = await dispatch_async_view(*match, environ)
+            await send({
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [
+                    (name.lower().encode("latin1"), value.encode("latin1"))
+                    for name, value in response.headers.to_wsgi_list()
+                ],
+            })
+            body = b"" if scope["method"] == "HEAD" else response.get_data()
+            await send({"type": "http.response.body", "body": body})
+            return
+
+    await wsgi_application(scope, receive, send)
@@ -0,0 +1,185 @@
+"""
+Compare sync (WSGI) and async (ASGI) serving under concurrent connections.
+
+Start both servers first, e.g.:
+
+    GUNICORN_BIND=127.0.0.1:8000 gunicorn -c gunicorn.conf.py app:app
+    GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker GUNICORN_BIND=127.0.0.1:8001 \
+        gunicorn -c gunicorn.conf.py asgi:application
+
+then:
+
+    python bench_serving.py --target sync=http://127.0.0.1:8000 --target async=http://127.0.0.1:8001
+
+Each concurrency level keeps that many client connections busy for a fixed
+duration. A level "holds" if errors stay under --max-error-rate and the p99
+latency stays under --p99-budget; the capacity is the highest level that holds.
+Failed and timed-out requests count towards the latency percentiles too.
+
+--slow-uploads N adds N background clients that keep POSTing a form body to
+--slow-path one byte at a time, like students uploading over a bad connection.
+They are not measured themselves; they show how the foreground requests cope
+while connections sit waiting on I/O.
+
+Only the standard library is used, so this runs without extra installs.
+"""
+import argparse
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+# Async views plus sync routes that the ASGI app hands to its WSGI thread pool
+DEFAULT_PATHS = ["/", "/store", "/marketplace", "/login", "/about"]
+DEFAULT_LEVELS = [10, 50, 100, 250, 500, 1000]
+
+
+async def fetch(host, port, path, timeout):
+    """One GET over a fresh connection; returns the HTTP status code."""
+    async def _fetch():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(
+                f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nConnection: close\r\n\r\n".encode()
+            )
+            await writer.drain()
+            status_line = await reader.readline()
+            await reader.read()  # drain until the server closes
+            return int(status_line.split()[1])
+        finally:
+            writer.close()
+
+    return await asyncio.wait_for(_fetch(), timeout)
+
+
+async def slow_upload(host, port, path, body_bytes, interval):
+    """POST a urlencoded body one byte every `interval` seconds."""
+    body = ("username=x&password=" + "x" * body_bytes)[:body_bytes].encode()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(
+            f"POST {path} HTTP/1.1\r\nHost: {host}:{port}\r\nConnection: close\r\n"
+            f"Content-Type: application/x-www-form-urlencoded\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode()
+        )
+        for i in range(len(body)):
+            writer.write(body[i:i + 1])
+            await writer.drain()
+            await asyncio.sleep(interval)
+        await reader.read()
+    finally:
+        writer.close()
+
+
+async def slow_uploader(host, port, path, body_bytes, interval, deadline):
+    while time.perf_counter() < deadline:
+        try:
+            await slow_upload(host, port, path, body_bytes, interval)
+        except OSError:
+            await asyncio.sleep(interval)
+
+
+async def client(host, port, paths, deadline, timeout, latencies, errors):
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            status = await fetch(host, port, path, timeout)
+            if status >= 500:
+                errors.append(status)
+        except (OSError, asyncio.TimeoutError, ValueError, IndexError) as e:
+            errors.append(type(e).__name__)
+        latencies.append(time.perf_counter() - start)
+
+
+def percentile(values, pct):
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_level(url, concurrency, paths, duration, timeout, args):
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+
+    uploaders = [
+        asyncio.create_task(slow_uploader(host, port, args.slow_path, args.slow_body_bytes,
+                                          args.slow_interval, deadline))
+        for _ in range(args.slow_uploads)
+    ]
+    if uploaders:
+        # Let the uploads occupy the server before measuring
+        await asyncio.sleep(args.slow_interval * 5)
+        deadline = time.perf_counter() + duration
+
+    await asyncio.gather(*(
+        client(host, port, paths, deadline, timeout, latencies, errors)
+        for _ in range(concurrency)
+    ))
+    for task in uploaders:
+        task.cancel()
+    await asyncio.gather(*uploaders, return_exceptions=True)
+
+    total = len(latencies)
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": len(errors),
+        "error_rate": len(errors) / total if total else 1.0,
+        "rps": (total - len(errors)) / duration,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+async def main(args):
+    paths = args.path or DEFAULT_PATHS
+    levels = args.levels or DEFAULT_LEVELS
+    capacity = {}
+
+    for target in args.target:
+        name, url = target.split("=", 1)
+        capacity[name] = 0
+        slow = f", {args.slow_uploads} slow uploads" if args.slow_uploads else ""
+        print(f"\n== {name} ({url}{slow}) ==")
+        print(f"{'conns':>6} {'reqs':>8} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9}")
+
+        for concurrency in levels:
+            result = await run_level(url, concurrency, paths, args.duration, args.timeout, args)
+            print(
+                f"{result['concurrency']:>6} {result['requests']:>8} {result['errors']:>7} "
+                f"{result['rps']:>9.1f} {result['p50_ms']:>9.1f} {result['p99_ms']:>9.1f}"
+            )
+            holds = result["error_rate"] <= args.max_error_rate and result["p99_ms"] <= args.p99_budget
+            if not holds:
+                break
+            capacity[name] = concurrency
+
+    print(f"\nCapacity (p99 <= {args.p99_budget:g} ms, errors <= {args.max_error_rate:.0%}):")
+    for name, conns in capacity.items():
+        print(f"  {name}: {conns} concurrent connections")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--target", action="append", metavar="NAME=URL",
+                        default=None, help="server to test; repeatable")
+    parser.add_argument("--path", action="append", help="path to request; repeatable")
+    parser.add_argument("--levels", type=int, nargs="+", help="concurrency levels to step through")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per level")
+    parser.add_argument("--timeout", type=float, default=10.0, help="per-request timeout in seconds")
+    parser.add_argument("--p99-budget", type=float, default=500.0, help="p99 latency budget in ms")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--slow-uploads", type=int, default=0, help="background slow-upload clients")
+    parser.add_argument("--slow-path", default="/login", help="path the slow uploads POST to")
+    parser.add_argument("--slow-body-bytes", type=int, default=64, help="size of each slow upload body")
+    parser.add_argument("--slow-interval", type=float, default=0.1, help="seconds between uploaded bytes")
+    args = parser.parse_args()
+    args.target = args.target or ["sync=http://127.0.0.1:8000", "async=http://127.0.0.1:8001"]
+
+    asyncio.run(main(args))
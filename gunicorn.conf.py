@@ -0,0 +1,36 @@
+"""
+Production server config.
+
+Sync mode (default, plain WSGI):
+    gunicorn -c gunicorn.conf.py app:app
+
+ASGI mode (opt-in for I/O-bound deployments, see asgi.py):
+    GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker gunicorn -c gunicorn.conf.py asgi:application
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "sync")
+
+# Same default for both modes so they can be compared like for like. A sync
+# worker holds one request at a time; a uvicorn worker adds an event loop for
+# the async pages and a WSGI_THREADS pool for every other route (asgi.py).
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+
+# Load app.py once in the master and fork, instead of importing it per worker
+preload_app = True
+
+keepalive = 5
+timeout = 30
+graceful_timeout = 30
+backlog = 2048
+
+
+def post_fork(server, worker):
+    # The preloaded app ran db.create_all() in the master; don't share its
+    # pooled connections with the forked workers.
+    from app import app, db
+
+    with app.app_context():
+        db.engine.dispose(close=False)
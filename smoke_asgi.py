@@ -0,0 +1,131 @@
+"""
+Smoke check for the async views in asgi.py.
+
+Renders every async page through `asgi.application` and through the sync app
+(`app.test_client()`), for an anonymous and a logged-in user, and fails if the
+status codes or page bodies differ. Catches async-only breakage such as a
+template reading a relationship that isn't eager-loaded (MissingGreenlet).
+
+    python smoke_asgi.py
+
+Runs against a throwaway SQLite database, not app.db.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+
+DB_DIR = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(DB_DIR, "smoke.db")
+os.environ.pop("ASYNC_DATABASE_URI", None)
+
+import asgi  # noqa: E402
+from app import app, db, User, Listing, Transaction, Order  # noqa: E402
+
+PATHS = [
+    "/",
+    "/store",
+    "/store?category=clothing&search=hoodie",
+    "/marketplace",
+    "/marketplace?category=dorm",
+    "/dashboard",
+    "/dashboard?tab=listings",
+]
+
+
+def seed():
+    with app.app_context():
+        alice = User(username="alice", email="alice@emu.edu")
+        bob = User(username="bob", email="bob@emu.edu")
+        alice.set_password("password")
+        bob.set_password("password")
+        db.session.add_all([alice, bob])
+        db.session.flush()
+
+        hoodie = Listing(itemName="EMU Hoodie", description="Blue hoodie.", category="clothing",
+                         price=49.99, listing_type="official_store", stock_quantity=5)
+        desk = Listing(itemName="Desk", description="Sturdy desk.", category="dorm",
+                       price=20.0, seller_id=alice.id)
+        lamp = Listing(itemName="Lamp", description="Desk lamp.", category="dorm",
+                       price=8.0, seller_id=bob.id)
+        db.session.add_all([hoodie, desk, lamp])
+        db.session.flush()
+
+        db.session.add(Transaction(listing_id=lamp.id, buyer_id=alice.id, seller_id=bob.id, price_paid=8.0))
+        db.session.add(Order(user_id=alice.id, listing_id=hoodie.id, quantity=1,
+                             total_price=49.99, status="confirmed"))
+        db.session.commit()
+        return alice.id
+
+
+async def asgi_get(path, cookie=None):
+    """GET through the ASGI app; returns (status, body)."""
+    path, _, query = path.partition("?")
+    headers = [(b"host", b"localhost")]
+    if cookie:
+        headers.append((b"cookie", cookie.encode("latin1")))
+    scope = {
+        "type": "http", "method": "GET", "path": path, "root_path": "",
+        "query_string": query.encode("latin1"), "headers": headers,
+        "http_version": "1.1", "scheme": "http",
+        "server": ("localhost", 80), "client": ("127.0.0.1", 50000),
+    }
+    response = {"body": b""}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        else:
+            response["body"] += message.get("body", b"")
+
+    await asgi.application(scope, receive, send)
+    return response["status"], response["body"]
+
+
+async def compare_pages(clients, failures):
+    for path in PATHS:
+        environ = asgi.build_environ(
+            {"type": "http", "method": "GET", "path": path.partition("?")[0],
+             "query_string": b"", "headers": [], "http_version": "1.1"},
+            None,
+        )
+        if not asgi.match_async_view(environ):
+            failures.append(f"{path}: not served by an async view")
+            continue
+
+        for label, client, client_cookie in clients:
+            status, body = await asgi_get(path, client_cookie)
+            sync_response = client.get(path)
+            ok = status == sync_response.status_code and body == sync_response.data and status in (200, 302)
+            print(f"{'ok  ' if ok else 'FAIL'} {path} ({label}): async {status}, sync {sync_response.status_code}")
+            if not ok:
+                failures.append(f"{path} ({label})")
+
+
+async def main():
+    failures = []
+
+    # Fresh process, empty database: the first request a worker ever serves
+    anonymous = app.test_client()
+    await compare_pages([("empty db", anonymous, None)], failures)
+
+    user_id = seed()
+    logged_in = app.test_client()
+    with logged_in.session_transaction() as sess:
+        sess["user_id"] = user_id
+    cookie = "session=" + logged_in.get_cookie("session").value
+    await compare_pages([("anonymous", anonymous, None), ("logged in", logged_in, cookie)], failures)
+
+    await asgi.async_engine.dispose()
+    return failures
+
+
+if __name__ == "__main__":
+    failures = asyncio.run(main())
+    if failures:
+        print("\nFailed:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print("\nAll async pages match the sync app.")